@@ -1,5 +1,6 @@
 import csv
 import datetime
+import os
 import re
 import uuid
 import logging
@@ -11,6 +12,9 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+JAKARTA = ZoneInfo("Asia/Jakarta")
+RP_PRICE_PATTERN = re.compile(r"Rp\s*([\d\.]+)")
+
 # Setup Selenium options
 options = Options()
 options.add_argument("--headless")
@@ -50,27 +54,30 @@ except Exception as e:
   jual_emas_text = None
 
 def get_harga(text):
-  re_match = re.search(r"Rp\s*([\d\.]+)", text)
+  re_match = RP_PRICE_PATTERN.search(text)
   if re_match:
     return re_match.group(1).replace(".", "")
 
 # Save data into CSV file
 if beli_emas_text and jual_emas_text:
-  new_data = {
-    "id": str(uuid.uuid4()),
-    "harga_beli": get_harga(beli_emas_text), 
-    "harga_jual": get_harga(jual_emas_text), 
-    "timestamp": datetime.datetime.now(ZoneInfo("Asia/Jakarta"))
-  }
+  new_data = [
+    str(uuid.uuid4()),
+    get_harga(beli_emas_text),
+    get_harga(jual_emas_text),
+    datetime.datetime.now(JAKARTA)
+  ]
 
   output_file = "datasets/harga_emas_pegadaian.csv"
-  
+  try:
+    write_header = os.path.getsize(output_file) == 0
+  except FileNotFoundError:
+    write_header = True
+
   with open(output_file, "a", newline="", encoding="utf-8") as f:
-    field_names = ["id", "harga_beli", "harga_jual", "timestamp"]
-    writer = csv.DictWriter(f, fieldnames=field_names)
+    writer = csv.writer(f)
 
-    if f.tell() == 0:
-      writer.writeheader()
+    if write_header:
+      writer.writerow(["id", "harga_beli", "harga_jual", "timestamp"])
 
     writer.writerow(new_data)
 
@@ -5,6 +5,8 @@ from src.harga_emas_pegadaian import HTMLDownloader, DataCleaning, DataStoring
 # --- Configuration ---
 LOG_FILE = "scraper.log"
 OUTPUT_FILE = "datasets/harga_emas_pegadaian.csv"
+# Keep a copy of the downloaded HTML on disk: python -m bots.harga_emas_pegadaian_v2 --debug
+DEBUG = "--debug" in sys.argv[1:]
 
 # Setup logging
 logging.basicConfig(
@@ -17,26 +19,28 @@ logging.basicConfig(
 )
 
 
-# STEP 1: Download the HTML using Selenium
-html_filename = None
-downloader = None
-try:
-    downloader = HTMLDownloader()
-    html_filename = downloader.run_scraper()
-except Exception as e:
-    logging.critical(f"HTML Downloader failed to run: {e}")
-finally:
-    if downloader:
-        downloader.quit_driver()
+# STEP 1: Download the HTML, trying a plain HTTP request before Selenium
+html = HTMLDownloader.run_http()
 
-if not html_filename:
+if not html:
+    logging.info("Falling back to Selenium.")
+    try:
+        with HTMLDownloader() as downloader:
+            html = downloader.run_scraper()
+    except Exception as e:
+        logging.critical(f"HTML Downloader failed to run: {e}")
+
+if not html:
     logging.critical("Failed to download HTML. Exiting.")
     sys.exit(1)
 
+if DEBUG:
+    HTMLDownloader.save_html(html)
+
 # STEP 2: Clean the price data
 cleaned_data = None
 try:
-    data_clean = DataCleaning(html_filename)
+    data_clean = DataCleaning(html)
     cleaned_data = data_clean.run()
 except Exception as e:
     logging.critical(f"Data cleaning failed to run: {e}")
@@ -47,7 +51,7 @@ if not cleaned_data:
 
 # STEP 3: Process the data and store to CSV
 try:
-    data_store = DataStoring(html_filename, OUTPUT_FILE, cleaned_data)
+    data_store = DataStoring(OUTPUT_FILE, cleaned_data)
     data_store.run()
     logging.info("Data successfully stored to CSV.")
 except Exception as e:
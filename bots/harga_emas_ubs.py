@@ -1,9 +1,8 @@
 import datetime
 import logging
 import sys
-from zoneinfo import ZoneInfo
 
-from src.harga_emas_ubs import DataFetching, DataCleaning, DataStoring, select_interval
+from src.harga_emas_ubs import JAKARTA, DataFetching, DataCleaning, DataStoring, select_interval
 
 # --- Configuration ---
 """ Runner
@@ -40,7 +39,7 @@ else:
     start_date = None
     end_date = None
     interval = 7
-    target_date = datetime.datetime.now(ZoneInfo("Asia/Jakarta")).date()
+    target_date = datetime.datetime.now(JAKARTA).date()
 
 # STEP 1: Fetch data from UBS API
 data = None
@@ -1,43 +1,112 @@
 import logging
 import re
+import io
 import os
 import csv
+import fcntl
+import socket
+import threading
 import uuid
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from itertools import islice
 from zoneinfo import ZoneInfo
 from typing import Optional
 
 import requests
-from bs4 import BeautifulSoup
-
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
 
 TARGET_URL = "https://sahabat.pegadaian.co.id/harga-emas"
+JAKARTA = ZoneInfo("Asia/Jakarta")
 PROXY_API_URL = "https://api.proxyscrape.com/v4/free-proxy-list/get?request=display_proxies&country=id&proxy_format=protocolipport&format=json&timeout=20000"
+# "Rp 29.630" -> "29.630": digits grouped by thousands separators only. The amount must
+# sit in text content (no "<" or ">" between the closing ">" of a tag and "Rp"), so attribute
+# values such as alt="Promo Rp 50.000" never match. Excluding ">" too keeps the scan linear
+# on script text full of "=>", as each ">" would otherwise restart a run to the next "<".
+PRICE_PATTERN = re.compile(r">[^<>]*?Rp\s*((?:\d{1,3}\.)*\d+)")
+# Title of the Cloudflare interstitial shown while the anti-bot check runs
+CHALLENGE_TITLE = "Just a moment..."
+# With page_load_strategy 'none', driver.get() returns while the tab still shows the
+# blank start page and no longer raises on failed navigations. This returns the URL once
+# the target document has committed and parsed its <head>, or as soon as Chrome shows its
+# own error page (proxy tunnel, DNS or connection failures), and false until then
+NAVIGATION_LANDED_JS = (
+    "var href = location.href;"
+    "return (href.startsWith('chrome-error:') || (href.startsWith('http') && document.readyState !== 'loading')) && href;"
+)
+CHROME_ERROR_PREFIX = "chrome-error:"
+# Matches on any direct text child, not only the first one as contains(text(), ...) would.
+# Scoped to rendered <body> content like DataCleaning.get_price_list, so "Rp" in <head>
+# metadata or script/JSON payloads can't end the wait before the price nodes exist
+PRICE_ELEMENT_XPATH = '//body//*[not(self::script)][text()[contains(., "Rp ")]]'
+# Seconds to wait for a TCP connect to a proxy before skipping it without starting Chrome
+PROXY_CHECK_TIMEOUT = 5
+# Number of proxies tried at the same time, each in its own Chrome
+PROXY_RACE_WORKERS = 4
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+# Requests Chrome should never make, as only the price text is needed
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.css",
+    "*google-analytics*", "*googletagmanager*", "*gtag*",
+]
 
 class HTMLDownloader:
     """
     Downloads the dynamic HTML content from the Pegadaian website using Selenium.
-    This class is strictly for downloading and saving the HTML source after the
-    main dynamic content has loaded, without validating specific price values.
-    Supports proxy rotation for resilient scraping.
+    The page source is returned in memory for DataCleaning; it is only written
+    to disk through save_html, which the v2 bot calls under --debug.
+    Supports proxy rotation for resilient scraping, and a browserless HTTP
+    fetch for when the prices are already server-side rendered.
     """
+    # Resolved once per process and shared by every driver, including each proxy attempt
+    _chromedriver_path: Optional[str] = None
+    _chromedriver_lock = threading.Lock()
+
     def __init__(self, proxy: Optional[str] = None):
-        """Initializes WebDriver and WebDriverWait with optional proxy."""
+        """Stores the optional proxy; Chrome is only started when first needed."""
         self.proxy = proxy
         self.driver = None
-        self._init_driver()
+        # Set by close(); may happen from another thread when a proxy race is lost
+        self._closed = False
+
+    def _ensure_driver(self):
+        """Start the WebDriver on first use."""
+        if self.driver is not None:
+            return
+        if self._closed:
+            raise RuntimeError("HTMLDownloader was closed before Chrome started.")
+        try:
+            self._init_driver()
+        except Exception:
+            # Don't leak a half-configured browser when setup fails
+            self.close()
+            raise
+        if self._closed:
+            # close() ran while Chrome was starting and could not see the new driver yet
+            self.close()
+            raise RuntimeError("HTMLDownloader was closed while Chrome was starting.")
 
     def _init_driver(self):
         """Initialize the Chrome WebDriver with current settings."""
         logging.info(f"Initializing Selenium WebDriver{f' with proxy {self.proxy}' if self.proxy else ''}.")
+        self._start(self._build_options(self.proxy))
+
+    @classmethod
+    def _get_chromedriver_path(cls) -> str:
+        """Resolve the chromedriver binary, reusing the result for later drivers."""
+        # Locked so concurrent proxy attempts don't download the driver twice
+        with cls._chromedriver_lock:
+            if cls._chromedriver_path is None:
+                from webdriver_manager.chrome import ChromeDriverManager
+                cls._chromedriver_path = ChromeDriverManager().install()
+        return cls._chromedriver_path
+
+    @staticmethod
+    def _build_options(proxy: Optional[str] = None):
+        """Build the Chrome options, optionally routed through a proxy."""
+        # Selenium is imported lazily so the HTTP-only path never pays for it
+        from selenium.webdriver.chrome.options import Options
+
         options = Options()
         # Use new headless mode (Chrome 109+)
         options.add_argument("--headless=new")
@@ -47,26 +116,44 @@ class HTMLDownloader:
         options.add_argument("--window-size=1920,1080")
         options.add_argument("--disable-blink-features=AutomationControlled")
         options.add_argument("--disable-extensions")
+        # Block images with Chrome's content setting (2 = block) rather than the
+        # --blink-settings flag: it is the supported profile-level switch and also
+        # covers images whose URLs miss the extension patterns blocked in _start
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+        })
 
         # --- ANTI-BOT DETECTION MEASURES ---
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
-        options.add_argument("user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+        options.add_argument(f"user-agent={USER_AGENT}")
 
         # Add proxy if provided
-        if self.proxy:
-            options.add_argument(f"--proxy-server={self.proxy}")
+        if proxy:
+            options.add_argument(f"--proxy-server={proxy}")
+
+        # Return from driver.get() immediately; run_scraper waits for the price element itself
+        options.page_load_strategy = 'none'
 
-        # Set page load strategy to avoid waiting for full load
-        options.page_load_strategy = 'eager'
+        return options
 
-        service = ChromeService(ChromeDriverManager().install())
+    def _start(self, options):
+        """Start Chrome with the given options and prepare the explicit wait."""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service as ChromeService
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        service = ChromeService(self._get_chromedriver_path())
         self.driver = webdriver.Chrome(service=service, options=options)
         self.wait = WebDriverWait(self.driver, 60)
-        self.driver.implicitly_wait(5)
 
-    def quit_driver(self):
-        """Quit the current driver."""
+        # Block images, fonts, stylesheets and trackers before the first navigation
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+
+    def close(self):
+        """Quit the current driver. Safe to call from another thread to cancel a scrape."""
+        self._closed = True
         if self.driver:
             try:
                 self.driver.quit()
@@ -75,9 +162,12 @@ class HTMLDownloader:
                 pass
             self.driver = None
 
-    def __del__(self):
-        """Ensures the driver quits when the object is destroyed."""
-        self.quit_driver()
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Ensures the driver quits when leaving the `with` block."""
+        self.close()
 
     @staticmethod
     def load_proxies(api_url: str = PROXY_API_URL) -> list[dict]:
@@ -105,10 +195,27 @@ class HTMLDownloader:
         """Format proxy dict to proxy string (ip:port format for Chrome)."""
         return f"{proxy_dict['ip']}:{proxy_dict['port']}"
 
-    def _save_to_html(self, content: str, filename: str) -> str:
-        """Saves the provided content to an HTML file."""
+    @staticmethod
+    def is_proxy_reachable(proxy: str) -> bool:
+        """
+        Cheap TCP connect to the proxy's ip:port, so dead proxies never start Chrome.
+        Nothing is sent through the proxy, so the protected target site is not hit twice.
+        """
+        host, _, port = proxy.rpartition(":")
+        try:
+            with socket.create_connection((host, int(port)), timeout=PROXY_CHECK_TIMEOUT):
+                return True
+        except (OSError, ValueError) as e:
+            logging.warning(f"Proxy {proxy} is unreachable: {e}")
+            return False
+
+    @staticmethod
+    def save_html(content: str) -> str:
+        """Saves the provided content to a timestamped HTML file for debugging."""
+        now_jakarta = datetime.now(JAKARTA)
+        timestamp_str = now_jakarta.strftime("%Y%m%d_%H%M%S")
+        filename = f"harga_emas_{timestamp_str}.html"
         try:
-            os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
             with open(filename, "w", encoding="utf-8") as f:
                 f.write(content)
             logging.info(f"Successfully saved page source to {filename}")
@@ -119,40 +226,52 @@ class HTMLDownloader:
 
     def run_scraper(self) -> Optional[str]:
         """
-        Executes the navigation and wait process, saves HTML, and returns the filename.
-        Only waits for the page structure to load, not specific price data.
+        Executes the navigation and wait process, and returns the page source.
+        Waits for the first rendered price element rather than polling the page source.
         """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
+
+        self._ensure_driver()
+
         try:
             self.driver.get(TARGET_URL)
-            logging.info(f"Navigated to: {TARGET_URL}")
+            logging.debug(f"Navigated to: {TARGET_URL}")
 
-            # 1. Wait for Anti-Bot Check to Pass (Essential)
+            # 1. Wait for the navigation to land, otherwise the title check below
+            # would pass immediately on the blank start page
             try:
-                self.wait.until_not(EC.title_is("Just a moment..."))
+                landed_url = self.wait.until(lambda driver: driver.execute_script(NAVIGATION_LANDED_JS))
+            except TimeoutException:
+                logging.error(f"Timeout waiting for {TARGET_URL} to start loading.")
+                return None
+            if landed_url.startswith(CHROME_ERROR_PREFIX):
+                logging.error(f"Navigation to {TARGET_URL} failed; Chrome showed its error page.")
+                return None
+
+            # 2. Wait for Anti-Bot Check to Pass (Essential)
+            try:
+                self.wait.until_not(EC.title_is(CHALLENGE_TITLE))
                 logging.info("Anti-bot check passed (Title changed).")
             except TimeoutException:
                 logging.error("Timeout waiting for anti-bot check to clear. The scraper may be blocked.")
                 return None
 
-            # Wait for prices to load by polling page source
-            max_wait = 60  # Maximum wait time in seconds
-            poll_interval = 2  # Check every 2 seconds
-            elapsed = 0
-
+            # 3. Wait for the first rendered price instead of polling the page source
             logging.info("Waiting for price data to load...")
-            while elapsed < max_wait:
-                page_source = self.driver.page_source
-                if "Rp " in page_source:
-                    logging.info(f"Price data detected after {elapsed} seconds.")
-                    break
-                time.sleep(poll_interval)
-                elapsed += poll_interval
-                logging.info(f"Still waiting for prices... ({elapsed}s elapsed)")
-            else:
-                logging.warning(f"Price data not detected after {max_wait} seconds. Saving HTML anyway for debugging.")
+            try:
+                self.wait.until(EC.presence_of_element_located((By.XPATH, PRICE_ELEMENT_XPATH)))
+                logging.info("Price data detected.")
+            except TimeoutException:
+                if self.driver.title == CHALLENGE_TITLE:
+                    logging.error("Still on the anti-bot challenge page. The scraper may be blocked.")
+                    return None
+                logging.warning("Price data not detected before timeout. Returning page source anyway for debugging.")
 
-            page_title = self.driver.title
-            logging.info(f"Page Title: {page_title}")
+            # Reading the title is a WebDriver round-trip, so only do it when it will be logged
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug(f"Page Title: {self.driver.title}")
 
             # Get page source with error handling
             try:
@@ -161,94 +280,184 @@ class HTMLDownloader:
                 logging.error(f"Failed to get page source: {e}")
                 return None
 
-            # Create a timestamped filename
-            now_jakarta = datetime.now(ZoneInfo("Asia/Jakarta"))
-            timestamp_str = now_jakarta.strftime("%Y%m%d_%H%M%S")
-            filename = f"harga_emas_{timestamp_str}.html"
-
-            return self._save_to_html(page_source, filename)
+            return page_source
 
         except Exception as e:
+            if self._closed:
+                logging.info("Scrape cancelled because the downloader was closed.")
+                return None
             logging.critical(f"A fatal error occurred during the HTML download process: {e}")
             return None
 
+    @staticmethod
+    def run_http(url: str = TARGET_URL) -> Optional[str]:
+        """
+        Fetches the page with a plain HTTP request, without starting a browser.
+        Only succeeds when DataCleaning can extract real (non-zero) prices from
+        the server-rendered HTML; returns None otherwise so the caller can fall
+        back to Selenium.
+        """
+        try:
+            response = requests.get(url, headers={"User-Agent": USER_AGENT}, timeout=30)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logging.warning(f"Direct HTTP fetch failed: {e}")
+            return None
+
+        # Validate with the same extraction DataCleaning uses, so placeholder or
+        # metadata-only "Rp" text never skips the Selenium fallback
+        if not DataCleaning(response.text).has_prices():
+            logging.info("Valid price data not found in server-rendered HTML.")
+            return None
+
+        logging.info(f"Fetched price data directly from: {url}")
+        return response.text
+
+    @classmethod
+    def _try_proxy(
+        cls,
+        position: str,
+        proxy_dict: dict,
+        stop: threading.Event,
+        live_downloaders: set,
+        live_lock: threading.Lock,
+    ) -> Optional[str]:
+        """
+        Run one scrape attempt through the given proxy, returning None on any failure.
+        The downloader is registered in `live_downloaders` while it runs so the caller
+        can close it once another proxy has won; `stop` keeps new attempts from starting.
+        """
+        from selenium.common.exceptions import WebDriverException
+
+        if stop.is_set():
+            return None
+
+        proxy_str = cls.format_proxy(proxy_dict)
+        uptime = proxy_dict.get('uptime', 0)
+        logging.info(f"Attempting proxy {position}: {proxy_str} (uptime: {uptime:.1f}%)")
+
+        if not cls.is_proxy_reachable(proxy_str):
+            return None
+
+        try:
+            with cls(proxy=proxy_str) as downloader:
+                with live_lock:
+                    if stop.is_set():
+                        return None
+                    live_downloaders.add(downloader)
+                try:
+                    result = downloader.run_scraper()
+                finally:
+                    with live_lock:
+                        live_downloaders.discard(downloader)
+        except WebDriverException as e:
+            # Errors after the race was lost come from close() killing this driver
+            if not stop.is_set():
+                logging.warning(f"Proxy {proxy_str} failed with WebDriver error: {e}")
+            return None
+        except Exception as e:
+            if not stop.is_set():
+                logging.warning(f"Proxy {proxy_str} failed with error: {e}")
+            return None
+
+        if stop.is_set():
+            logging.info(f"Proxy {proxy_str} attempt cancelled after another proxy succeeded.")
+            return None
+
+        if result:
+            logging.info(f"Successfully scraped using proxy: {proxy_str}")
+        else:
+            logging.warning(f"Proxy {proxy_str} failed to get valid result.")
+        return result
+
     @classmethod
     def run_with_proxy_rotation(cls, api_url: str = PROXY_API_URL) -> Optional[str]:
         """
         Run scraper with proxy rotation. Fetches fresh proxies from API and
-        tries each proxy until one succeeds. Falls back to no proxy if all fail.
+        races up to PROXY_RACE_WORKERS of them at a time, returning the first
+        success. Falls back to no proxy if all fail.
 
         Returns:
-            The filename of the saved HTML, or None if all attempts fail.
+            The page source, or None if all attempts fail.
         """
         proxies = cls.load_proxies(api_url)
 
         if not proxies:
             logging.warning("No proxies available. Running without proxy.")
-            downloader = cls()
-            try:
+            with cls() as downloader:
                 return downloader.run_scraper()
-            finally:
-                downloader.quit_driver()
-
-        # Try each proxy
-        for i, proxy_dict in enumerate(proxies):
-            proxy_str = cls.format_proxy(proxy_dict)
-            uptime = proxy_dict.get('uptime', 0)
-            logging.info(f"Attempting proxy {i + 1}/{len(proxies)}: {proxy_str} (uptime: {uptime:.1f}%)")
-
-            downloader = None
-            try:
-                downloader = cls(proxy=proxy_str)
-                result = downloader.run_scraper()
 
+        # Race the proxies, highest uptime first, and keep the first page that comes back
+        logging.info(f"Trying {len(proxies)} proxies, {PROXY_RACE_WORKERS} at a time.")
+        stop = threading.Event()
+        live_downloaders = set()
+        live_lock = threading.Lock()
+        executor = ThreadPoolExecutor(max_workers=PROXY_RACE_WORKERS)
+        futures = [
+            executor.submit(cls._try_proxy, f"{i + 1}/{len(proxies)}", proxy_dict, stop, live_downloaders, live_lock)
+            for i, proxy_dict in enumerate(proxies)
+        ]
+        try:
+            for future in as_completed(futures):
+                result = future.result()
                 if result:
-                    logging.info(f"Successfully scraped using proxy: {proxy_str}")
                     return result
-                else:
-                    logging.warning(f"Proxy {proxy_str} failed to get valid result. Trying next proxy...")
-
-            except WebDriverException as e:
-                logging.warning(f"Proxy {proxy_str} failed with WebDriver error: {e}. Trying next proxy...")
-            except Exception as e:
-                logging.warning(f"Proxy {proxy_str} failed with error: {e}. Trying next proxy...")
-            finally:
-                if downloader:
-                    downloader.quit_driver()
+        finally:
+            # Keep queued attempts from starting, quit the Chromes of attempts still
+            # running, then wait for their threads so no browser outlives this call
+            stop.set()
+            with live_lock:
+                losers = list(live_downloaders)
+            for downloader in losers:
+                downloader.close()
+            executor.shutdown(wait=True, cancel_futures=True)
 
         # All proxies failed, try without proxy as last resort
         logging.warning("All proxies failed. Attempting without proxy as fallback...")
-        downloader = cls()
-        try:
+        with cls() as downloader:
             return downloader.run_scraper()
-        finally:
-            downloader.quit_driver()
 
 
 class DataCleaning:
     EXPECTED_PRICE_COUNT = 2
 
-    def __init__(self, html_file):
-        self.html_file = html_file
+    def __init__(self, html: str):
+        self.html = html
 
     def get_price_list(self):
-        with open(self.html_file, "r", encoding="utf-8") as f:
-            soup = BeautifulSoup(f.read(), 'html.parser')
-        return soup.find_all(string=re.compile("Rp "))
+        """
+        Scan the raw HTML for the first "Rp" amounts in text content, skipping the
+        <head> metadata. Matches are anchored to text between tags, so "Rp" inside
+        attribute values is ignored.
+        """
+        body_start = max(self.html.find("<body"), 0)
+        matches = PRICE_PATTERN.finditer(self.html, body_start)
+        # Stop scanning as soon as the expected prices are found
+        return [m.group(1) for m in islice(matches, self.EXPECTED_PRICE_COUNT)]
+
+    @staticmethod
+    def _has_placeholder(prices: list[str]) -> bool:
+        """Check for zero amounts, which the page shows before real values render."""
+        return any(int(price.replace(".", "")) == 0 for price in prices)
+
+    def has_prices(self) -> bool:
+        """Check that the expected number of prices can be extracted and none is zero."""
+        prices = self.get_price_list()
+        return len(prices) == self.EXPECTED_PRICE_COUNT and not self._has_placeholder(prices)
 
     def _check_loading_state(self):
         """Check if the page is still in loading state."""
-        with open(self.html_file, "r", encoding="utf-8") as f:
-            content = f.read()
+        # Lowercase the page once rather than once per indicator
+        content = self.html.lower()
 
         loading_indicators = ['loading-spinner', 'skeleton', 'nuxt-loading']
-        found_indicators = [ind for ind in loading_indicators if ind.lower() in content.lower()]
+        found_indicators = [ind for ind in loading_indicators if ind in content]
 
         return found_indicators
 
     def run(self):
         raw_data = self.get_price_list()
-        cleaned_prices = ["".join(re.findall(r'\d+', item)) for item in raw_data]
+        cleaned_prices = [item.replace(".", "") for item in raw_data]
 
         if len(cleaned_prices) < self.EXPECTED_PRICE_COUNT:
             logging.error(f"Expected at least {self.EXPECTED_PRICE_COUNT} prices, found {len(cleaned_prices)}")
@@ -263,13 +472,18 @@ class DataCleaning:
 
             return None
 
+        if self._has_placeholder(cleaned_prices):
+            logging.error(f"Extracted placeholder prices {cleaned_prices}; page has not rendered real values.")
+            return None
+
         logging.info(f"Prices loaded successfully. Extracted {len(cleaned_prices)} prices: {cleaned_prices[:self.EXPECTED_PRICE_COUNT]}")
         return cleaned_prices
     
 
 class DataStoring:
-    def __init__(self, html_file, output_file, price_list):
-        self.html_file = html_file
+    FIELD_NAMES = ["id", "harga_beli", "harga_jual", "timestamp"]
+
+    def __init__(self, output_file, price_list):
         self.output_file = output_file
         self.price_list = price_list
 
@@ -277,23 +491,34 @@ class DataStoring:
         if not self.price_list or len(self.price_list) < 2:
             raise ValueError(f"Invalid price list: expected at least 2 prices, got {len(self.price_list) if self.price_list else 0}")
 
-        return {
-            "id": uuid.uuid4(),
-            "harga_beli": self.price_list[0],
-            "harga_jual": self.price_list[1],
-            "timestamp": datetime.now(ZoneInfo("Asia/Jakarta"))
-        }
+        # Row values in FIELD_NAMES order
+        return [
+            uuid.uuid4(),
+            self.price_list[0],
+            self.price_list[1],
+            datetime.now(JAKARTA),
+        ]
 
     def insert_new_data(self):
-        with open(self.output_file, "a", newline="", encoding="utf-8") as f:
-            field_names = ["id", "harga_beli", "harga_jual", "timestamp"]
-            writer = csv.DictWriter(f, fieldnames=field_names)
+        row = self.process_new_data()
+
+        # O_APPEND plus a single write() keeps concurrent runs from interleaving rows
+        fd = os.open(self.output_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            # Hold the lock while checking the size so only one run writes the header
+            fcntl.flock(fd, fcntl.LOCK_EX)
 
-            if f.tell() == 0:
-                writer.writeheader()
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
 
-            writer.writerow(self.process_new_data())
+            if os.fstat(fd).st_size == 0:
+                writer.writerow(self.FIELD_NAMES)
+
+            writer.writerow(row)
+            os.write(fd, buffer.getvalue().encode("utf-8"))
+        finally:
+            # Closing the descriptor also releases the lock
+            os.close(fd)
 
     def run(self):
         self.insert_new_data()
-        os.remove(self.html_file)
\ No newline at end of file
@@ -1,30 +1,61 @@
+import bisect
 import csv
 import datetime
+import functools
 import logging
+import os
+import secrets
 import uuid
+from types import MappingProxyType
 from zoneinfo import ZoneInfo
 from typing import Optional
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 UBS_URL = "https://ubslifestyle.com/wp-admin/admin-ajax.php"
+JAKARTA = ZoneInfo("Asia/Jakarta")
 AVAILABLE_INTERVALS = [7, 30, 90, 180, 365, 1095]
+# (connect, read) timeout in seconds for UBS requests
+REQUEST_TIMEOUT = (5, 15)
 
 
-def build_payload(interval: int = 7) -> dict:
-    return {
+@functools.lru_cache(maxsize=len(AVAILABLE_INTERVALS))
+def build_payload(interval: int = 7) -> MappingProxyType:
+    """Build the request payload once per interval; read-only because it is shared."""
+    return MappingProxyType({
         "action": "get_harga_emas_hari_ini",
         "path": f"ajax/chart_interval_jual/GOLD/{interval}",
-    }
+    })
+
+
+def build_session() -> requests.Session:
+    """Create a keep-alive session that retries transient failures."""
+    # The endpoint is a read-only query, so retrying the POST is safe
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"POST"}),
+    )
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared by every DataFetching instance so connections are reused across fetches
+_SESSION = build_session()
 
 
 def select_interval(start_date: datetime.date, end_date: datetime.date) -> int:
     """Select the smallest available interval that covers the date range."""
     days_diff = (end_date - start_date).days + 1
-    for interval in AVAILABLE_INTERVALS:
-        if interval >= days_diff:
-            return interval
-    return AVAILABLE_INTERVALS[-1]
+    # AVAILABLE_INTERVALS is sorted, so the first interval >= days_diff is at bisect_left
+    index = bisect.bisect_left(AVAILABLE_INTERVALS, days_diff)
+    return AVAILABLE_INTERVALS[min(index, len(AVAILABLE_INTERVALS) - 1)]
 
 
 class DataFetching:
@@ -38,12 +69,12 @@ class DataFetching:
         """Fetch data from UBS API and return the JSON response."""
         logging.info(f"Fetching harga emas UBS with path: {self.payload['path']}")
         try:
-            response = requests.post(self.url, data=self.payload)
+            response = _SESSION.post(self.url, data=self.payload, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             logging.info("Data fetched successfully.")
             return data
-        except requests.RequestException as e:
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             logging.error(f"Failed to fetch data: {e}")
             return None
 
@@ -67,7 +98,7 @@ class DataCleaning:
     def _parse_entry(entry: list) -> dict:
         """Parse a single data entry [timestamp_ms, open, high, low, close]."""
         entry_date = datetime.datetime.fromtimestamp(
-            entry[0] / 1000, tz=ZoneInfo("Asia/Jakarta")
+            entry[0] / 1000, tz=JAKARTA
         ).date()
         return {
             "price": entry[4],
@@ -76,10 +107,10 @@ class DataCleaning:
 
     def _run_single(self) -> Optional[dict]:
         """Parse and validate for a single target date."""
-        target = self.target_date or datetime.datetime.now(ZoneInfo("Asia/Jakarta")).date()
+        target = self.target_date or datetime.datetime.now(JAKARTA).date()
         latest_entry = self.data[0]["data"][-1]
         entry_date = datetime.datetime.fromtimestamp(
-            latest_entry[0] / 1000, tz=ZoneInfo("Asia/Jakarta")
+            latest_entry[0] / 1000, tz=JAKARTA
         ).date()
 
         if entry_date != target:
@@ -92,15 +123,21 @@ class DataCleaning:
         logging.info(f"Harga Buyback: {result['price']}")
         return result
 
+    @staticmethod
+    def _day_start_ms(date: datetime.date) -> int:
+        """Epoch milliseconds of midnight in Jakarta on the given date."""
+        return int(datetime.datetime.combine(date, datetime.time.min, tzinfo=JAKARTA).timestamp() * 1000)
+
     def _run_bulk(self) -> Optional[list[dict]]:
         """Parse and filter entries within the start_date to end_date range."""
-        results = []
-        for entry in self.data[0]["data"]:
-            entry_date = datetime.datetime.fromtimestamp(
-                entry[0] / 1000, tz=ZoneInfo("Asia/Jakarta")
-            ).date()
-            if self.start_date <= entry_date <= self.end_date:
-                results.append(self._parse_entry(entry))
+        # Compare raw timestamps so only matching entries are converted to datetimes
+        start_ms = self._day_start_ms(self.start_date)
+        end_ms = self._day_start_ms(self.end_date + datetime.timedelta(days=1))
+        results = [
+            self._parse_entry(entry)
+            for entry in self.data[0]["data"]
+            if start_ms <= entry[0] < end_ms
+        ]
 
         if not results:
             logging.warning(
@@ -136,25 +173,38 @@ class DataStoring:
         self.price_data = price_data
 
     @staticmethod
-    def _build_row(entry: dict) -> dict:
-        return {
-            "id": str(uuid.uuid4()),
-            "price": entry["price"],
-            "date": entry["date"],
-            "timestamp": datetime.datetime.now(ZoneInfo("Asia/Jakarta")),
-        }
+    def _generate_ids(count: int) -> list[str]:
+        """Generate `count` UUID4 strings from a single random draw."""
+        raw = secrets.token_bytes(16 * count)
+        return [str(uuid.UUID(bytes=raw[i:i + 16], version=4)) for i in range(0, len(raw), 16)]
+
+    @staticmethod
+    def _build_row(entry: dict, row_id: str, timestamp: datetime.datetime) -> tuple:
+        """Row values in FIELD_NAMES order."""
+        return (row_id, entry["price"], entry["date"], timestamp)
+
+    def _needs_header(self) -> bool:
+        """Check with a single stat whether the output file is missing or empty."""
+        try:
+            return os.path.getsize(self.output_file) == 0
+        except FileNotFoundError:
+            return True
 
     def run(self):
         """Append row(s) to the CSV file."""
         entries = self.price_data if isinstance(self.price_data, list) else [self.price_data]
 
+        write_header = self._needs_header()
+
         with open(self.output_file, "a", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=self.FIELD_NAMES)
+            writer = csv.writer(f)
 
-            if f.tell() == 0:
-                writer.writeheader()
+            if write_header:
+                writer.writerow(self.FIELD_NAMES)
 
-            for entry in entries:
-                writer.writerow(self._build_row(entry))
+            # Rows from one run share a single ingestion timestamp
+            now = datetime.datetime.now(JAKARTA)
+            row_ids = self._generate_ids(len(entries))
+            writer.writerows(self._build_row(entry, row_id, now) for entry, row_id in zip(entries, row_ids))
 
         logging.info(f"{len(entries)} row(s) of harga emas UBS added successfully!")